@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 
-import configparser
+import hashlib
 import os
-import shutil
+import platform
 import subprocess
 import sys
+import sysconfig
 import urllib.request
-from distutils.errors import DistutilsPlatformError
+from distutils.errors import DistutilsError, DistutilsPlatformError
 from distutils.log import INFO
 
 import setuptools
@@ -20,12 +21,25 @@ class sdist(_sdist):
 
     def run(self):
         # build `pyproject.toml` from `setup.cfg`
-        c = configparser.ConfigParser()
-        c.add_section("build-system")
-        c.set("build-system", "requires", str(self.distribution.setup_requires))
-        c.set("build-system", 'build-backend', '"setuptools.build_meta"')
-        with open("pyproject.toml", "w") as pyproject:
-            c.write(pyproject)
+        content = (
+            "[build-system]\n"
+            "requires = {}\n"
+            'build-backend = "setuptools.build_meta"\n'
+            "\n"
+        ).format(self.distribution.setup_requires)
+
+        # only rewrite `pyproject.toml` if its content changed, to avoid
+        # mtime churn invalidating timestamp-based build caches
+        try:
+            with open("pyproject.toml", "rb") as pyproject:
+                existing = pyproject.read()
+        except FileNotFoundError:
+            existing = None
+        if content.encode("utf-8") != existing:
+            # disable newline translation so the bytes on disk match the
+            # comparison above on Windows too
+            with open("pyproject.toml", "w", newline="") as pyproject:
+                pyproject.write(content)
 
         # run the rest of the packaging
         _sdist.run(self)
@@ -35,6 +49,33 @@ class build_rust(_build_rust):
 
     def run(self):
 
+        # ABI tag of the running interpreter, used to key the caches below
+        # (SOABI is unset on Windows CPython, hence the fallback on the
+        # implementation name)
+        abi = sysconfig.get_config_var("SOABI") or "{}-{}.{}".format(
+            platform.python_implementation().lower(),
+            sys.version_info.major,
+            sys.version_info.minor,
+        )
+
+        # compile to a stable target directory keyed by platform and the
+        # interpreter ABI so that successive builds (possibly from different
+        # source trees or virtual environments) reuse the compiled
+        # dependencies, without CPython and PyPy invalidating each other's
+        # PyO3 artifacts
+        os.environ.setdefault("CARGO_TARGET_DIR", os.path.join(
+            os.path.expanduser(os.path.join("~", ".cache", "fastobo-cargo-target")),
+            platform.machine(),
+            abi,
+        ))
+        os.environ.setdefault("CARGO_INCREMENTAL", "1" if self.inplace else "0")
+
+        # pin the interpreter used by the PyO3 build script so that it does
+        # not invalidate the cached crates when invoked with a different
+        # `python` binary (e.g. from an IDE or another shell)
+        os.environ.setdefault("PYO3_PYTHON", sys.executable)
+        os.environ.setdefault("PYO3_ENVIRONMENT_SIGNATURE", abi)
+
         try:
             rustc = get_rust_version()
             nightly = rustc.prerelease is not None and "nightly" in rustc.prerelease
@@ -50,38 +91,87 @@ class build_rust(_build_rust):
         if nightly:
             self.extensions[0].features.append("nightly")
 
+        # when vendored crates are available, build offline to skip the
+        # crates.io registry refresh entirely
+        if self.extensions[0].args is None:
+            self.extensions[0].args = []
+        if os.path.isdir("crates") and os.path.exists(os.path.join(".cargo", "config.toml")):
+            self.extensions[0].args.append("--offline")
+
+        # build with the locked dependency resolution, downloading all the
+        # crates upfront so the compilation step never waits on the network
+        if os.path.exists("Cargo.lock"):
+            self.extensions[0].args.append("--locked")
+            if "--offline" not in self.extensions[0].args:
+                try:
+                    subprocess.call(["cargo", "fetch", "--locked"])
+                except OSError:
+                    pass
+
         _build_rust.run(self)
 
 
     def setup_temp_rustc_unix(self, toolchain, profile):
 
-        rustup_sh = os.path.join(self.build_temp, "rustup.sh")
-        os.environ["CARGO_HOME"] = os.path.join(self.build_temp, "cargo")
-        os.environ["RUSTUP_HOME"] = os.path.join(self.build_temp, "rustup")
-
-        self.mkpath(os.environ["CARGO_HOME"])
-        self.mkpath(os.environ["RUSTUP_HOME"])
-
-        self.announce("downloading rustup.sh install script", level=INFO)
-        with urllib.request.urlopen("https://sh.rustup.rs") as res:
-            with open(rustup_sh, "wb") as dst:
-                shutil.copyfileobj(res, dst)
-
-        self.announce("installing Rust compiler to {}".format(self.build_temp), level=INFO)
-        subprocess.call([
-            "sh",
-            rustup_sh,
-            "-y",
-            "--default-toolchain",
+        # install the compiler to a user-level cache keyed by toolchain and
+        # profile, so that successive builds can reuse it even after the
+        # temporary build directory has been wiped
+        cache_root = os.path.join(
+            os.path.expanduser(os.path.join("~", ".cache", "fastobo")),
             toolchain,
-            "--profile",
             profile,
-            "--no-modify-path"
-        ])
+        )
+        os.environ["CARGO_HOME"] = os.path.join(cache_root, "cargo")
+        os.environ["RUSTUP_HOME"] = os.path.join(cache_root, "rustup")
+        cargo_bin = os.path.join(os.environ["CARGO_HOME"], "bin")
+
+        if not os.path.exists(os.path.join(cargo_bin, "rustc")):
+            self.mkpath(os.environ["CARGO_HOME"])
+            self.mkpath(os.environ["RUSTUP_HOME"])
+            self.mkpath(self.build_temp)
+
+            rustup_sh = os.path.join(self.build_temp, "rustup.sh")
+            self.announce("downloading rustup.sh install script", level=INFO)
+            hasher = hashlib.sha256()
+            with urllib.request.urlopen("https://sh.rustup.rs") as res:
+                with open(rustup_sh, "wb") as dst:
+                    for chunk in iter(lambda: res.read(65536), b""):
+                        hasher.update(chunk)
+                        dst.write(chunk)
+
+            # check the download against a pinned checksum when one is given
+            # (the script is unversioned so there is no stable upstream digest)
+            digest = hasher.hexdigest()
+            expected = os.environ.get("FASTOBO_RUSTUP_SHA256")
+            if expected is not None and digest != expected.lower():
+                raise DistutilsError(
+                    "rustup.sh checksum mismatch: expected {}, got {}".format(expected, digest)
+                )
+            self.announce("rustup.sh sha256: {}".format(digest), level=INFO)
+
+            self.announce("installing Rust compiler to {}".format(cache_root), level=INFO)
+            os.environ.setdefault("CARGO_NET_RETRY", "10")
+            os.environ.setdefault("CARGO_HTTP_MULTIPLEXING", "true")
+            subprocess.run(
+                [
+                    "sh",
+                    rustup_sh,
+                    "-y",
+                    "--default-toolchain",
+                    toolchain,
+                    "--profile",
+                    profile,
+                    "--no-modify-path"
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+        else:
+            self.announce("using cached Rust compiler from {}".format(cache_root), level=INFO)
 
         self.announce("updating $PATH variable to use local Rust compiler", level=INFO)
         os.environ["PATH"] = ":".join([
-            os.path.abspath(os.path.join(os.environ["CARGO_HOME"], "bin")),
+            os.path.abspath(cargo_bin),
             os.environ["PATH"]
         ])
 
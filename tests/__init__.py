@@ -0,0 +1,17 @@
+# coding: utf-8
+
+import os
+
+
+def load_tests(loader, tests, pattern):
+    """load_test function used by unittest to find the tests lazily"""
+    # only discover when invoked from the discovery machinery, which always
+    # passes a pattern: `setup.py test` uses setuptools' ScanningLoader,
+    # which calls this hook with no pattern and then scans the submodules
+    # itself, so discovering here too would collect every test twice
+    if pattern is not None:
+        tests.addTests(loader.discover(
+            os.path.dirname(__file__),
+            pattern=pattern,
+        ))
+    return tests
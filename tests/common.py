@@ -0,0 +1,29 @@
+# coding: utf-8
+"""Shared fixtures for the `fastobo` test suite.
+"""
+
+import functools
+
+import fastobo
+
+# invalid arguments shared by the `test_init_type_error` tests
+_BAD_SINGLE = (1, [1], ["abc"], "abc")
+
+
+@functools.lru_cache(maxsize=None)
+def _pident(prefix, local):
+    """Build a `PrefixedIdent`, reusing instances across the test suite"""
+    return fastobo.id.PrefixedIdent(prefix, local)
+
+
+@functools.lru_cache(maxsize=None)
+def _uident(name):
+    """Build an `UnprefixedIdent`, reusing instances across the test suite"""
+    return fastobo.id.UnprefixedIdent(name)
+
+
+# sentinel cross-reference shared by several test modules; the tests only
+# ever read it, so a single Rust-side instance is enough for the whole run
+ISBN_ID = _pident('ISBN', '0321842685')
+ISBN_DESC = "Hacker's Delight (2nd Edition)"
+ISBN_XREF = fastobo.xref.Xref(ISBN_ID, ISBN_DESC)
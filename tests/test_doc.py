@@ -1,6 +1,5 @@
 # coding: utf-8
 
-import datetime
 import unittest
 
 import fastobo
@@ -23,28 +22,19 @@ class TestOboDoc(unittest.TestCase):
         ]
 
     def test_init(self):
-        try:
-            doc = self.type()
-        except Exception:
-            self.fail("could not create `OboDoc` instances")
+        doc = self.type()
         self.assertEqual(len(doc.header), 0)
         self.assertEqual(len(doc), 0)
 
     def test_init_header(self):
-        try:
-            doc = self.type(self.header)
-        except Exception:
-            self.fail("could not create `OboDoc` instances with a header")
+        doc = self.type(self.header)
         self.assertEqual(len(doc.header), 2)
         self.assertEqual(doc.header[0], self.header[0])
         self.assertEqual(doc.header[1], self.header[1])
         self.assertEqual(len(doc), 0)
 
     def test_init_entities(self):
-        try:
-            doc = self.type(entities=self.entities)
-        except Exception:
-            self.fail("could not create `OboDoc` instances with a header")
+        doc = self.type(entities=self.entities)
         self.assertEqual(len(doc.header), 0)
         self.assertEqual(len(doc), 2)
         self.assertEqual(doc[0], self.entities[0])
@@ -2,10 +2,11 @@
 """Test doctest contained tests in every file of the module.
 """
 
-import os
 import sys
 import datetime
 import doctest
+import functools
+import pathlib
 import warnings
 import pprint
 import textwrap
@@ -13,6 +14,14 @@ import types
 
 import fastobo
 
+MS = str(pathlib.Path(__file__).resolve().parent.joinpath("data", "ms.obo"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ms():
+    """Load the `ms.obo` test document, parsing it at most once"""
+    return fastobo.load(MS, threads=0)
+
 
 def _load_tests_from_module(tests, module, globs, setUp=None, tearDown=None):
     """Load tests from module, iterating through submodules"""
@@ -43,9 +52,7 @@ def load_tests(loader, tests, ignore):
         "datetime": datetime,
         "textwrap": textwrap,
         "pprint": pprint.pprint,
-        "ms": fastobo.load(os.path.realpath(
-            os.path.join(__file__, "..", "data", "ms.obo")
-        )),
+        "ms": _load_ms(),
     }
 
     if not sys.argv[0].endswith('green'):
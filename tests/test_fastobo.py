@@ -1,13 +1,18 @@
 # coding: utf-8
 
-import os
+import io
+import pathlib
 import unittest
 
 import fastobo
 
-MS = os.path.realpath(os.path.join(__file__, "..", "data", "ms.obo"))
+MS = str(pathlib.Path(__file__).resolve().parent.joinpath("data", "ms.obo"))
 MS_FRAMES = 2941
 
+# read the document once so the file-handle tests don't re-read 10MB from
+# disk for every test method
+_MS_BYTES = pathlib.Path(MS).read_bytes()
+
 class TestLoad(unittest.TestCase):
 
     def test_file_not_found(self):
@@ -38,25 +43,22 @@ class TestLoad(unittest.TestCase):
         doc = fastobo.load(MS, threads=1)
         self.assertEqual(len(doc), MS_FRAMES)
 
-        with open(MS, 'rb') as f:
-            doc = fastobo.load(f, threads=1)
-            self.assertEqual(len(doc), MS_FRAMES)
+        doc = fastobo.load(io.BytesIO(_MS_BYTES), threads=1)
+        self.assertEqual(len(doc), MS_FRAMES)
 
     def test_threading_explicit(self):
         doc = fastobo.load(MS, threads=4)
         self.assertEqual(len(doc), MS_FRAMES)
 
-        with open(MS, 'rb') as f:
-            doc = fastobo.load(f, threads=4)
-            self.assertEqual(len(doc), MS_FRAMES)
+        doc = fastobo.load(io.BytesIO(_MS_BYTES), threads=4)
+        self.assertEqual(len(doc), MS_FRAMES)
 
     def test_threading_detect(self):
         doc = fastobo.load(MS, threads=0)
         self.assertEqual(len(doc), MS_FRAMES)
 
-        with open(MS, 'rb') as f:
-            doc = fastobo.load(f, threads=0)
-            self.assertEqual(len(doc), MS_FRAMES)
+        doc = fastobo.load(io.BytesIO(_MS_BYTES), threads=0)
+        self.assertEqual(len(doc), MS_FRAMES)
 
     def test_threading_invalid(self):
         self.assertRaises(ValueError, fastobo.load, MS, threads=-1)
@@ -78,25 +80,22 @@ class TestIter(unittest.TestCase):
         frame_count = sum(1 for _ in fastobo.iter(MS, threads=1))
         self.assertEqual(frame_count, MS_FRAMES)
 
-        with open(MS, 'rb') as f:
-            frame_count = sum(1 for _ in fastobo.iter(f, threads=1))
-            self.assertEqual(frame_count, MS_FRAMES)
+        frame_count = sum(1 for _ in fastobo.iter(io.BytesIO(_MS_BYTES), threads=1))
+        self.assertEqual(frame_count, MS_FRAMES)
 
     def test_threading_explicit(self):
         frame_count = sum(1 for _ in fastobo.iter(MS, threads=4))
         self.assertEqual(frame_count, MS_FRAMES)
 
-        with open(MS, 'rb') as f:
-            frame_count = sum(1 for _ in fastobo.iter(f, threads=4))
-            self.assertEqual(frame_count, MS_FRAMES)
+        frame_count = sum(1 for _ in fastobo.iter(io.BytesIO(_MS_BYTES), threads=4))
+        self.assertEqual(frame_count, MS_FRAMES)
 
     def test_threading_detect(self):
         frame_count = sum(1 for _ in fastobo.iter(MS, threads=0))
         self.assertEqual(frame_count, MS_FRAMES)
 
-        with open(MS, 'rb') as f:
-            frame_count = sum(1 for _ in fastobo.iter(f, threads=0))
-            self.assertEqual(frame_count, MS_FRAMES)
+        frame_count = sum(1 for _ in fastobo.iter(io.BytesIO(_MS_BYTES), threads=0))
+        self.assertEqual(frame_count, MS_FRAMES)
 
     def test_threading_invalid(self):
         self.assertRaises(ValueError, fastobo.iter, MS, threads=-1)
@@ -105,8 +104,7 @@ class TestLoads(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        with open(MS, 'r') as f:
-            cls.text = f.read()
+        cls.text = _MS_BYTES.decode("utf-8")
 
     def test_threading_single(self):
         doc = fastobo.loads(self.text, threads=1)
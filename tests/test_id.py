@@ -1,6 +1,5 @@
 # coding: utf-8
 
-import datetime
 import unittest
 
 import fastobo
@@ -20,10 +19,7 @@ class TestUnprefixedIdent(_TestBaseIdent, unittest.TestCase):
     type = fastobo.id.UnprefixedIdent
 
     def test_init(self):
-        try:
-            self.type('created_by')
-        except Exception:
-            self.fail("could not instantiate `UnprefixedIdent`")
+        self.type('created_by')
 
     def test_eq(self):
         ident = self.type('derived_from')
@@ -51,10 +47,7 @@ class TestPrefixedIdent(_TestBaseIdent, unittest.TestCase):
     type = fastobo.id.PrefixedIdent
 
     def test_init(self):
-        try:
-            self.type('GO', '0070412')
-        except Exception:
-            self.fail("could not instantiate `PrefixedIdent`")
+        self.type('GO', '0070412')
 
     def test_init_type_error(self):
         self.assertRaises(TypeError, self.type, "GO", 123)
@@ -73,10 +66,7 @@ class TestUrl(_TestBaseIdent, unittest.TestCase):
     type = fastobo.id.Url
 
     def test_init(self):
-        try:
-            self.type('http://purl.obolibrary.org/obo/GO_0070412')
-        except Exception:
-            self.fail("could not instantiate `Url`")
+        self.type('http://purl.obolibrary.org/obo/GO_0070412')
 
     def test_init_type_error(self):
         self.assertRaises(TypeError, self.type, 123)
@@ -1,39 +1,29 @@
 # coding: utf-8
 
-import datetime
 import unittest
 
 import fastobo
 
+from tests.common import _uident, ISBN_DESC, ISBN_ID, ISBN_XREF
+
 
 class TestXref(unittest.TestCase):
 
     type = fastobo.xref.Xref
 
     def test_init(self):
-        id = fastobo.id.PrefixedIdent('ISBN', '0321842685')
-        try:
-            xref = self.type(id)
-        except Exception:
-            self.fail("could not create `Xref` instance without description")
-        try:
-            xref = self.type(id, "Hacker's Delight (2nd Edition)")
-        except Exception:
-            self.fail("could not create `Xref` instance with description")
+        self.type(ISBN_ID)
+        self.type(ISBN_ID, ISBN_DESC)
 
     def test_init_type_error(self):
-        id = fastobo.id.PrefixedIdent('ISBN', '0321842685')
-        desc = "Hacker's Delight (2nd Edition)"
-        self.assertRaises(TypeError, self.type, 1)
-        self.assertRaises(TypeError, self.type, 1, desc)
-        self.assertRaises(TypeError, self.type, id, 1)
+        for args in ((1,), (1, ISBN_DESC), (ISBN_ID, 1)):
+            with self.subTest(args=args):
+                self.assertRaises(TypeError, self.type, *args)
 
     def test_str(self):
-        id = fastobo.id.PrefixedIdent('ISBN', '0321842685')
-        desc = "Hacker's Delight (2nd Edition)"
-        self.assertEqual(str(self.type(id)), "ISBN:0321842685")
+        self.assertEqual(str(self.type(ISBN_ID)), "ISBN:0321842685")
         self.assertEqual(
-            str(self.type(id, desc)),
+            str(self.type(ISBN_ID, ISBN_DESC)),
             'ISBN:0321842685 "Hacker\'s Delight (2nd Edition)"'
         )
 
@@ -42,51 +32,43 @@ class TestXrefList(unittest.TestCase):
 
     type = fastobo.xref.XrefList
 
-    def setUp(self):
-        id = fastobo.id.PrefixedIdent('ISBN', '0321842685')
-        desc = "Hacker's Delight (2nd Edition)"
-        self.x1 = fastobo.xref.Xref(id, desc)
-        self.x2 = fastobo.xref.Xref(fastobo.id.UnprefixedIdent("fastobo"))
+    @classmethod
+    def setUpClass(cls):
+        cls.x1 = ISBN_XREF
+        cls.x2 = fastobo.xref.Xref(_uident("fastobo"))
+        # lists shared by the tests that never mutate them
+        cls.empty = cls.type()
+        cls.single = cls.type([cls.x1])
+        cls.pair = cls.type([cls.x1, cls.x2])
 
     def test_init(self):
-        try:
-            xref = self.type()
-        except Exception:
-            self.fail("could not create `XrefList` instance without argument")
-        try:
-            xref = self.type([self.x1, self.x2])
-        except Exception:
-            self.fail("could not create `XrefList` instance from list")
-        try:
-            xref = self.type(iter([self.x1, self.x2]))
-        except Exception:
-            self.fail("could not create `XrefList` instance from iterator")
+        self.type()
+        self.type([self.x1, self.x2])
+        self.type(iter([self.x1, self.x2]))
 
     def test_init_type_error(self):
         # Errors on an iterator of type != Xref
-        self.assertRaises(TypeError, self.type, "abc")
-        self.assertRaises(TypeError, self.type, ["abc", "def"])
+        for bad in ("abc", ["abc", "def"]):
+            with self.subTest(bad=bad):
+                self.assertRaises(TypeError, self.type, bad)
 
     def test_str(self):
         x1, x2 = self.x1, self.x2
-        self.assertEqual(str(self.type()), "[]")
-        self.assertEqual(str(self.type([x1])), '[{}]'.format(x1))
-        self.assertEqual(str(self.type([x1, x2])), '[{}, {}]'.format(x1, x2))
+        self.assertEqual(str(self.empty), "[]")
+        self.assertEqual(str(self.single), '[{}]'.format(x1))
+        self.assertEqual(str(self.pair), '[{}, {}]'.format(x1, x2))
 
     def test_contains(self):
         x1, x2 = self.x1, self.x2
-        l1 = self.type()
-        self.assertNotIn(x1, l1)
-        self.assertNotIn(x2, l1)
-        l2 = self.type([x1])
-        self.assertIn(x1, l2)
-        self.assertNotIn(x2, l2)
-        l3 = self.type([x1, x2])
-        self.assertIn(x1, l3)
-        self.assertIn(x2, l3)
+        self.assertNotIn(x1, self.empty)
+        self.assertNotIn(x2, self.empty)
+        self.assertIn(x1, self.single)
+        self.assertNotIn(x2, self.single)
+        self.assertIn(x1, self.pair)
+        self.assertIn(x2, self.pair)
 
     def test_repr(self):
         x1, x2 = self.x1, self.x2
-        self.assertEqual( repr(self.type()), "XrefList()" )
-        self.assertEqual( repr(self.type([x1])), "XrefList([{!r}])".format(x1) )
-        self.assertEqual( repr(self.type([x1, x2])), "XrefList([{!r}, {!r}])".format(x1, x2) )
+        self.assertEqual( repr(self.empty), "XrefList()" )
+        self.assertEqual( repr(self.single), "XrefList([{!r}])".format(x1) )
+        self.assertEqual( repr(self.pair), "XrefList([{!r}, {!r}])".format(x1, x2) )